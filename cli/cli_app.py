@@ -463,6 +463,15 @@ class CLIApp:
             await self.cleanup_mcp_app()
 
 
+def run_event_loop(coro):
+    """使用uvloop运行协程（若已安装，Windows不可用），否则回退到asyncio.run"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 async def main():
     """主函数"""
     start_time = time.time()
@@ -497,4 +506,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -7,8 +7,12 @@ Enhanced CLI Interface Module for DeepCode
 import os
 import time
 import platform
+from collections import deque
 from typing import Optional
 
+# Maximum number of entries kept in the in-session processing history
+MAX_HISTORY_ENTRIES = 50
+
 
 class Colors:
     """ANSI color codes for terminal styling"""
@@ -38,7 +42,7 @@ class CLIInterface:
     def __init__(self):
         self.uploaded_file = None
         self.is_running = True
-        self.processing_history = []
+        self.processing_history = deque(maxlen=MAX_HISTORY_ENTRIES)
         self.enable_indexing = (
             False  # Default configuration (matching UI: fast mode by default)
         )
@@ -73,6 +77,7 @@ class CLIInterface:
         cli_dir = os.path.dirname(current_file)  # cli directory
         project_root = os.path.dirname(cli_dir)  # project root
         config_path = os.path.join(project_root, "mcp_agent.config.yaml")
+        tmp_path = config_path + ".tmp"
 
         try:
             # Read current config
@@ -88,15 +93,23 @@ class CLIInterface:
                 self.segmentation_threshold
             )
 
-            # Write updated config
-            with open(config_path, "w", encoding="utf-8") as f:
+            # Write updated config atomically: a crash mid-write must not
+            # leave a truncated mcp_agent.config.yaml behind
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+            os.replace(tmp_path, config_path)
 
             print(
                 f"{Colors.OKGREEN}✅ Document segmentation configuration updated{Colors.ENDC}"
             )
 
         except Exception as e:
+            # Don't leave a partial temp file next to the config
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             print(
                 f"{Colors.WARNING}⚠️ Failed to update segmentation config: {str(e)}{Colors.ENDC}"
             )
@@ -935,7 +948,7 @@ class CLIInterface:
     def add_to_history(self, input_source: str, result: dict):
         """Add processing result to history"""
         entry = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": time.time(),  # formatted only when history is shown
             "input_source": input_source,
             "status": result.get("status", "unknown"),
             "result": result,
@@ -957,7 +970,10 @@ class CLIInterface:
             if len(source) > 50:
                 source = source[:47] + "..."
 
-            print(f"{i}. {status_icon} {entry['timestamp']} | {source}")
+            timestamp = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(entry["timestamp"])
+            )
+            print(f"{i}. {status_icon} {timestamp} | {source}")
 
         self.print_separator("─", 79, Colors.CYAN)
 
@@ -9,7 +9,6 @@ DeepCode CLI - Open-Source Code Agent
 
 import os
 import sys
-import asyncio
 import argparse
 
 # 禁止生成.pyc文件
@@ -22,7 +21,7 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 # 导入CLI应用
-from cli.cli_app import CLIApp, Colors
+from cli.cli_app import CLIApp, Colors, run_event_loop
 
 
 def print_enhanced_banner():
@@ -334,4 +333,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
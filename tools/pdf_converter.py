@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import subprocess
 import tempfile
 import shutil
@@ -36,10 +37,64 @@ class PDFConverter:
     # Class-level logger
     logger = logging.getLogger(__name__)
 
+    # LibreOffice command found by the first successful detection
+    _libreoffice_cmd: Optional[str] = None
+
     def __init__(self) -> None:
         """Initialize the PDF converter."""
         pass
 
+    @classmethod
+    def _find_libreoffice_command(cls) -> Optional[str]:
+        """
+        Find a working LibreOffice command.
+
+        Setting the LIBREOFFICE_CMD environment variable skips detection.
+        Otherwise the first command answering ``--version`` is cached, so
+        later conversions do not spawn detection subprocesses again.
+
+        Returns:
+            The command to invoke, or None if LibreOffice was not found
+        """
+        override = os.environ.get("LIBREOFFICE_CMD")
+        if override:
+            return override
+        if cls._libreoffice_cmd is not None:
+            return cls._libreoffice_cmd
+
+        # Prepare subprocess parameters to hide console window on Windows
+        subprocess_kwargs: Dict[str, Any] = {
+            "capture_output": True,
+            "check": True,
+            "timeout": 10,
+            "encoding": "utf-8",
+            "errors": "ignore",
+        }
+
+        # Hide console window on Windows
+        if platform.system() == "Windows":
+            subprocess_kwargs["creationflags"] = (
+                0x08000000  # subprocess.CREATE_NO_WINDOW
+            )
+
+        for cmd in ["libreoffice", "soffice"]:
+            try:
+                result = subprocess.run([cmd, "--version"], **subprocess_kwargs)
+            except (
+                subprocess.CalledProcessError,
+                FileNotFoundError,
+                subprocess.TimeoutExpired,
+            ):
+                continue
+
+            logging.info(
+                f"LibreOffice detected with command '{cmd}': {result.stdout.strip()}"  # type: ignore
+            )
+            cls._libreoffice_cmd = cmd
+            return cmd
+
+        return None
+
     @staticmethod
     def convert_office_to_pdf(
         doc_path: Union[str, Path], output_dir: Optional[str] = None
@@ -71,58 +126,10 @@ class PDFConverter:
 
             base_output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Check if LibreOffice is available
-            libreoffice_available = False
-            working_libreoffice_cmd: Optional[str] = None
-
-            # Prepare subprocess parameters to hide console window on Windows
-            subprocess_kwargs: Dict[str, Any] = {
-                "capture_output": True,
-                "check": True,
-                "timeout": 10,
-                "encoding": "utf-8",
-                "errors": "ignore",
-            }
-
-            # Hide console window on Windows
-            if platform.system() == "Windows":
-                subprocess_kwargs["creationflags"] = (
-                    0x08000000  # subprocess.CREATE_NO_WINDOW
-                )
-
-            try:
-                result = subprocess.run(
-                    ["libreoffice", "--version"], **subprocess_kwargs
-                )
-                libreoffice_available = True
-                working_libreoffice_cmd = "libreoffice"
-                logging.info(f"LibreOffice detected: {result.stdout.strip()}")  # type: ignore
-            except (
-                subprocess.CalledProcessError,
-                FileNotFoundError,
-                subprocess.TimeoutExpired,
-            ):
-                pass
+            # Locate LibreOffice (detection result is cached across calls)
+            working_libreoffice_cmd = PDFConverter._find_libreoffice_command()
 
-            # Try alternative commands for LibreOffice
-            if not libreoffice_available:
-                for cmd in ["soffice", "libreoffice"]:
-                    try:
-                        result = subprocess.run([cmd, "--version"], **subprocess_kwargs)
-                        libreoffice_available = True
-                        working_libreoffice_cmd = cmd
-                        logging.info(
-                            f"LibreOffice detected with command '{cmd}': {result.stdout.strip()}"  # type: ignore
-                        )
-                        break
-                    except (
-                        subprocess.CalledProcessError,
-                        FileNotFoundError,
-                        subprocess.TimeoutExpired,
-                    ):
-                        continue
-
-            if not libreoffice_available:
+            if working_libreoffice_cmd is None:
                 raise RuntimeError(
                     "LibreOffice is required for Office document conversion but was not found.\n"
                     "Please install LibreOffice:\n"
@@ -162,9 +169,11 @@ class PDFConverter:
                             str(doc_path),
                         ]
 
-                        # Prepare conversion subprocess parameters
+                        # Prepare conversion subprocess parameters; only stderr is
+                        # reported, so stdout is discarded instead of buffered
                         convert_subprocess_kwargs: Dict[str, Any] = {
-                            "capture_output": True,
+                            "stdout": subprocess.DEVNULL,
+                            "stderr": subprocess.PIPE,
                             "text": True,
                             "timeout": 60,  # 60 second timeout
                             "encoding": "utf-8",
@@ -531,29 +540,8 @@ class PDFConverter:
             "reportlab": False,
         }
 
-        # Check LibreOffice
-        try:
-            subprocess_kwargs: Dict[str, Any] = {
-                "capture_output": True,
-                "text": True,
-                "check": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-            }
-
-            if platform.system() == "Windows":
-                subprocess_kwargs["creationflags"] = (
-                    0x08000000  # subprocess.CREATE_NO_WINDOW
-                )
-
-            subprocess.run(["libreoffice", "--version"], **subprocess_kwargs)
-            results["libreoffice"] = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                subprocess.run(["soffice", "--version"], **subprocess_kwargs)
-                results["libreoffice"] = True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+        # Check LibreOffice (honours LIBREOFFICE_CMD and the cached detection)
+        results["libreoffice"] = self._find_libreoffice_command() is not None
 
         # Check ReportLab
         import importlib.util
@@ -16,8 +16,10 @@ Features:
 
 import os
 import re
+import asyncio
 import aiohttp
 import aiofiles
+import aiofiles.os
 import shutil
 import sys
 import io
@@ -38,7 +40,8 @@ try:
 except ImportError:
     DOCLING_AVAILABLE = False
     print(
-        "Warning: docling package not available. Document conversion will be disabled."
+        "Warning: docling package not available. Document conversion will be disabled.",
+        file=sys.stderr,
     )
 
 # Fallback PDF text extraction
@@ -49,7 +52,8 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
     print(
-        "Warning: PyPDF2 package not available. Fallback PDF extraction will be disabled."
+        "Warning: PyPDF2 package not available. Fallback PDF extraction will be disabled.",
+        file=sys.stderr,
     )
 
 # 设置标准输出编码为UTF-8
@@ -67,6 +71,9 @@ if sys.stdout.encoding != "utf-8":
 # 创建 FastMCP 实例
 mcp = FastMCP("smart-pdf-downloader")
 
+# 单次指令中并发下载/复制的最大文件数
+MAX_CONCURRENT_DOWNLOADS = 8
+
 
 # 辅助函数
 def format_success_message(action: str, details: Dict[str, Any]) -> str:
@@ -84,6 +91,17 @@ def format_warning_message(action: str, warning: str) -> str:
     return f"⚠️ {action}\n   Warning: {warning}"
 
 
+def _convert_pdf_in_worker(file_path: str) -> Dict[str, Any]:
+    """
+    在工作线程中执行PDF转换
+
+    Markdown正文已写入文件，不再回传给调用方。
+    """
+    result = SimplePdfConverter().convert_pdf_to_markdown(file_path)
+    result.pop("markdown_content", None)
+    return result
+
+
 async def perform_document_conversion(
     file_path: str, extract_images: bool = True
 ) -> Optional[str]:
@@ -115,8 +133,10 @@ async def perform_document_conversion(
 
     if is_pdf_file and PYPDF2_AVAILABLE:
         try:
-            simple_converter = SimplePdfConverter()
-            conversion_result = simple_converter.convert_pdf_to_markdown(file_path)
+            # PDF文本提取较耗时，放到工作线程中执行以免阻塞事件循环
+            conversion_result = await asyncio.to_thread(
+                _convert_pdf_in_worker, file_path
+            )
             if conversion_result["success"]:
                 conversion_msg = "\n   [INFO] PDF converted to Markdown (PyPDF2)"
                 conversion_msg += (
@@ -802,7 +822,7 @@ async def download_file(url: str, destination: str) -> Dict[str, Any]:
                 # 确保目标目录存在
                 parent_dir = os.path.dirname(destination)
                 if parent_dir:
-                    os.makedirs(parent_dir, exist_ok=True)
+                    await aiofiles.os.makedirs(parent_dir, exist_ok=True)
 
                 # 下载文件
                 downloaded = 0
@@ -846,7 +866,7 @@ async def move_local_file(source_path: str, destination: str) -> Dict[str, Any]:
 
     try:
         # 检查源文件是否存在
-        if not os.path.exists(source_path):
+        if not await aiofiles.os.path.exists(source_path):
             return {
                 "success": False,
                 "source": source_path,
@@ -855,15 +875,17 @@ async def move_local_file(source_path: str, destination: str) -> Dict[str, Any]:
             }
 
         # 获取源文件信息
-        source_size = os.path.getsize(source_path)
+        source_size = await aiofiles.os.path.getsize(source_path)
 
         # 确保目标目录存在
         parent_dir = os.path.dirname(destination)
         if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
+            await aiofiles.os.makedirs(parent_dir, exist_ok=True)
 
         # 执行复制操作（保留原文件，防止数据丢失）
-        shutil.copy2(source_path, destination)
+        # 在工作线程中复制，避免阻塞事件循环；shutil会使用内核零拷贝
+        # （Linux上的sendfile、macOS上的fcopyfile），数据不经过Python缓冲区
+        await asyncio.to_thread(shutil.copy2, source_path, destination)
 
         # 计算操作时间
         duration = (datetime.now() - start_time).total_seconds()
@@ -886,6 +908,65 @@ async def move_local_file(source_path: str, destination: str) -> Dict[str, Any]:
         }
 
 
+async def _download_and_convert(
+    url: str, destination: str, semaphore: asyncio.Semaphore
+) -> str:
+    """下载单个URL并执行文档转换，返回格式化的结果消息"""
+    async with semaphore:
+        try:
+            # 先检查URL是否可访问
+            check_result = await check_url_accessible(url)
+            if not check_result["accessible"]:
+                return f"[ERROR] Failed to access {url}: HTTP {check_result['status'] or 'Connection failed'}"
+
+            # 执行下载
+            result = await download_file(url, destination)
+
+            # 执行转换（如果成功下载）
+            conversion_msg = None
+            if result["success"]:
+                conversion_msg = await perform_document_conversion(
+                    destination, extract_images=True
+                )
+
+            # 格式化结果
+            return format_file_operation_result(
+                "download", url, destination, result, conversion_msg
+            )
+
+        except Exception as e:
+            msg = f"[ERROR] Failed to download: {url}\n"
+            msg += f"   Error: {str(e)}"
+            return msg
+
+
+async def _copy_and_convert(
+    local_path: str, destination: str, semaphore: asyncio.Semaphore
+) -> str:
+    """复制单个本地文件并执行文档转换，返回格式化的结果消息"""
+    async with semaphore:
+        try:
+            # 执行复制（保留原文件）
+            result = await move_local_file(local_path, destination)
+
+            # 执行转换（如果成功复制）
+            conversion_msg = None
+            if result["success"]:
+                conversion_msg = await perform_document_conversion(
+                    destination, extract_images=True
+                )
+
+            # 格式化结果
+            return format_file_operation_result(
+                "copy", local_path, destination, result, conversion_msg
+            )
+
+        except Exception as e:
+            msg = f"[ERROR] Failed to copy: {local_path}\n"
+            msg += f"   Error: {str(e)}"
+            return msg
+
+
 @mcp.tool()
 async def download_files(instruction: str) -> str:
     """
@@ -918,7 +999,10 @@ async def download_files(instruction: str) -> str:
     # 处理文件
     results = []
 
-    # 处理URL下载
+    # 处理URL下载（先确定目标路径，再并发执行下载）
+    jobs = []
+    pending_destinations = set()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
     for url in urls:
         try:
             # 推断文件名
@@ -943,43 +1027,26 @@ async def download_files(instruction: str) -> str:
                 # 默认下载到当前目录
                 destination = filename
 
-            # 检查文件是否已存在
-            if os.path.exists(destination):
+            # 检查文件是否已存在（包括本次指令中已排队的下载）
+            if os.path.exists(destination) or destination in pending_destinations:
                 results.append(
                     f"[WARNING] Skipped {url}: File already exists at {destination}"
                 )
                 continue
 
-            # 先检查URL是否可访问
-            check_result = await check_url_accessible(url)
-            if not check_result["accessible"]:
-                results.append(
-                    f"[ERROR] Failed to access {url}: HTTP {check_result['status'] or 'Connection failed'}"
-                )
-                continue
-
-            # 执行下载
-            result = await download_file(url, destination)
-
-            # 执行转换（如果成功下载）
-            conversion_msg = None
-            if result["success"]:
-                conversion_msg = await perform_document_conversion(
-                    destination, extract_images=True
-                )
-
-            # 格式化结果
-            msg = format_file_operation_result(
-                "download", url, destination, result, conversion_msg
+            # 预留结果位置，保证输出顺序与URL顺序一致
+            pending_destinations.add(destination)
+            results.append(None)
+            jobs.append(
+                (len(results) - 1, _download_and_convert(url, destination, semaphore))
             )
 
         except Exception as e:
             msg = f"[ERROR] Failed to download: {url}\n"
             msg += f"   Error: {str(e)}"
+            results.append(msg)
 
-        results.append(msg)
-
-    # 处理本地文件移动
+    # 处理本地文件移动（与URL下载一起并发执行）
     for local_path in local_paths:
         try:
             # 获取文件名
@@ -1004,33 +1071,32 @@ async def download_files(instruction: str) -> str:
                 # 默认移动到当前目录
                 destination = filename
 
-            # 检查目标文件是否已存在
-            if os.path.exists(destination):
+            # 检查目标文件是否已存在（包括本次指令中已排队的操作）
+            if os.path.exists(destination) or destination in pending_destinations:
                 results.append(
                     f"[WARNING] Skipped {local_path}: File already exists at {destination}"
                 )
                 continue
 
-            # 执行复制（保留原文件）
-            result = await move_local_file(local_path, destination)
-
-            # 执行转换（如果成功复制）
-            conversion_msg = None
-            if result["success"]:
-                conversion_msg = await perform_document_conversion(
-                    destination, extract_images=True
+            pending_destinations.add(destination)
+            results.append(None)
+            jobs.append(
+                (
+                    len(results) - 1,
+                    _copy_and_convert(local_path, destination, semaphore),
                 )
-
-            # 格式化结果
-            msg = format_file_operation_result(
-                "copy", local_path, destination, result, conversion_msg
             )
 
         except Exception as e:
             msg = f"[ERROR] Failed to copy: {local_path}\n"
             msg += f"   Error: {str(e)}"
+            results.append(msg)
 
-        results.append(msg)
+    # 下载与复制任务一次性并发执行，结果按原顺序回填
+    if jobs:
+        outputs = await asyncio.gather(*(job for _, job in jobs))
+        for (index, _), output in zip(jobs, outputs):
+            results[index] = output
 
     return "\n\n".join(results)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import html
 import base64
+import os
 import sys
 from datetime import datetime
 from functools import lru_cache
@@ -19,9 +20,21 @@ import streamlit as st
 
 from utils.cross_platform_file_handler import get_file_handler
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 ICON_DIR = BASE_DIR / "assets" / "icons"
 
+# Static runtime facts shown by the diagnostics panel, computed once at import
+PYTHON_VERSION = sys.version.split()[0]
+PLATFORM_NAME = sys.platform
+
+# Session state key prefix for the saved path of each uploaded file
+UPLOAD_CACHE_KEY_PREFIX = "_saved_upload_"
+
 
 @lru_cache(maxsize=64)
 def _icon_data_uri(name: str) -> str:
@@ -281,14 +294,29 @@ def chat_input_component(task_counter: int = 0) -> Optional[str]:
 
 
 def _save_uploaded_pdf(uploaded_file) -> Optional[str]:
-    """Persist uploaded PDF to a temp file and return its path."""
+    """Persist uploaded PDF to a temp file and return its path.
+
+    Streamlit reruns the script on every interaction, so the saved path is
+    remembered per upload and the file is only written once.
+    """
+    # Only Streamlit's per-upload file_id identifies the content; a file name
+    # could belong to a different upload, so skip caching without it
+    upload_id = getattr(uploaded_file, "file_id", None)
+    cache_key = f"{UPLOAD_CACHE_KEY_PREFIX}{upload_id}" if upload_id else None
+    cached_path = st.session_state.get(cache_key) if cache_key else None
+    if cached_path and Path(cached_path).exists():
+        return cached_path
+
     try:
-        file_bytes = uploaded_file.read()
         suffix = Path(uploaded_file.name).suffix or ".pdf"
         handler = get_file_handler()
-        temp_path = handler.create_safe_temp_file(
-            suffix=suffix, prefix="deepcode_upload_", content=file_bytes
-        )
+        # Write straight from the upload buffer instead of copying it via read()
+        with uploaded_file.getbuffer() as file_buffer:
+            temp_path = handler.create_safe_temp_file(
+                suffix=suffix, prefix="deepcode_upload_", content=file_buffer
+            )
+        if cache_key:
+            st.session_state[cache_key] = str(temp_path)
         return str(temp_path)
     except Exception as exc:
         st.error(f"Failed to save uploaded file: {exc}")
@@ -401,20 +429,19 @@ def system_status_component():
 
     with col1:
         st.markdown("#### 📊 Core Metrics")
-        st.info(f"**Python:** {sys.version.split()[0]}")
-        st.info(f"**Platform:** {sys.platform}")
+        st.info(f"**Python:** {PYTHON_VERSION}")
+        st.info(f"**Platform:** {PLATFORM_NAME}")
 
     with col2:
         st.markdown("#### ⚙️ Runtime Status")
-        try:
-            import asyncio
+        import asyncio
 
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                st.success("Event Loop: ACTIVE")
-            else:
-                st.warning("Event Loop: STANDBY")
-        except Exception:
+        # Probe with get_running_loop() rather than the deprecated
+        # get_event_loop(); scripts run in Streamlit's ScriptRunner thread
+        try:
+            asyncio.get_running_loop()
+            st.success("Event Loop: ACTIVE")
+        except RuntimeError:
             st.info("Event Loop: MANAGED")
 
 
@@ -526,6 +553,22 @@ def render_system_monitor():
         st.warning(f"Last error: {last_error}")
 
 
+def _read_tail_lines(path: Path, max_lines: int, block_size: int = 65536) -> List[str]:
+    """Return the last ``max_lines`` lines of a file, reading it backwards in blocks."""
+    with path.open("rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        # Read until more than max_lines newlines are buffered; the first
+        # buffered line may be partial and is dropped by the final slice
+        while position > 0 and data.count(b"\n") <= max_lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    return data.decode("utf-8", errors="ignore").splitlines()[-max_lines:]
+
+
 def render_log_viewer(max_lines: int = 50):
     """Display live log stream for current mission in a scrollable container."""
     st.markdown("#### 📁 Live Log Stream")
@@ -574,14 +617,11 @@ def render_log_viewer(max_lines: int = 50):
     st.session_state.active_log_file = str(selected_path)
 
     try:
-        content = selected_path.read_text(encoding="utf-8", errors="ignore")
+        tail_lines = _read_tail_lines(selected_path, max_lines)
     except Exception as exc:
         st.error(f"Failed to read {selected_path.name}: {exc}")
         return
 
-    lines = content.splitlines()
-    tail_lines = lines[-max_lines:]
-
     # Show file info
     processing = st.session_state.get("processing", False)
     status_icon = "🔄" if processing else "✅"
@@ -602,7 +642,7 @@ def render_log_viewer(max_lines: int = 50):
             continue
 
         try:
-            event = json.loads(line)
+            event = json_loads(line)
             timestamp = event.get("timestamp", "")
             level = event.get("level", "INFO")
             message = event.get("message", "")
@@ -10,6 +10,7 @@ import os
 import traceback
 import atexit
 import signal
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any
 
@@ -440,10 +441,16 @@ def handle_processing_workflow(
         }
 
     current_step = 0
+    last_update = None
 
     # Define enhanced progress callback function
     def update_progress(progress: int, message: str):
-        nonlocal current_step
+        nonlocal current_step, last_update
+
+        # Coalesce repeated ticks: skip re-rendering an unchanged update
+        if (progress, message) == last_update:
+            return
+        last_update = (progress, message)
 
         # Update progress bar
         progress_bar.progress(progress)
@@ -451,7 +458,8 @@ def handle_processing_workflow(
 
         # Determine current step
         new_step = step_mapping.get(progress, current_step)
-        if new_step != current_step:
+        step_changed = new_step != current_step
+        if step_changed:
             current_step = new_step
             update_step_indicator(
                 step_indicators, workflow_steps, current_step, "active"
@@ -468,7 +476,8 @@ def handle_processing_workflow(
             message,
             extra={"progress": progress},
         )
-        time.sleep(0.3)  # Brief pause for users to see progress changes
+        if step_changed:
+            time.sleep(0.3)  # Brief pause for users to see stage changes
 
     # Step 1: Initialization
     if chat_mode:
@@ -584,7 +593,7 @@ def update_session_state_with_result(result: Dict[str, Any], input_type: str):
         # Save to history
         st.session_state.results.append(
             {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": time.time(),
                 "input_type": input_type,
                 "status": "success",
                 "result": result,
@@ -597,17 +606,13 @@ def update_session_state_with_result(result: Dict[str, Any], input_type: str):
         # Save error to history
         st.session_state.results.append(
             {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": time.time(),
                 "input_type": input_type,
                 "status": "error",
                 "error": result.get("error", "Unknown error"),
             }
         )
 
-    # Limit history to maximum 50 records
-    if len(st.session_state.results) > 50:
-        st.session_state.results = st.session_state.results[-50:]
-
 
 def cleanup_temp_file(input_source: str, input_type: str):
     """
@@ -618,6 +623,13 @@ def cleanup_temp_file(input_source: str, input_type: str):
         input_type: Input type
     """
     if input_type == "file" and input_source:
+        # Forget saved upload paths so the keys do not pile up in session state
+        from .components import UPLOAD_CACHE_KEY_PREFIX
+
+        for key in list(st.session_state.keys()):
+            if str(key).startswith(UPLOAD_CACHE_KEY_PREFIX):
+                del st.session_state[key]
+
         try:
             from utils.cross_platform_file_handler import get_file_handler
 
@@ -845,7 +857,7 @@ def _background_workflow_runner(
     # Create a simple progress callback that only logs (no Streamlit UI calls)
     def background_progress_callback(progress: int, message: str):
         # Just log to Python logger, which will be captured by our logging handler
-        logging.info(f"Progress: {progress}% - {message}")
+        logging.info("Progress: %d%% - %s", progress, message)
 
     try:
         # Call the core async workflow directly without UI components
@@ -1019,7 +1031,8 @@ def initialize_session_state():
     if "processing" not in st.session_state:
         st.session_state.processing = False
     if "results" not in st.session_state:
-        st.session_state.results = []
+        # Bounded history: keeps the latest 50 records without re-slicing
+        st.session_state.results = deque(maxlen=50)
     if "current_step" not in st.session_state:
         st.session_state.current_step = 0
     if "task_counter" not in st.session_state:
@@ -10,6 +10,10 @@ from typing import Optional, Dict, Any
 
 import streamlit as st
 
+# Number of feed events retained; the list is compacted back to this size
+# only once it has grown to twice the limit.
+MAX_SIDEBAR_EVENTS = 80
+
 
 def _init_event_store():
     if "sidebar_events" not in st.session_state:
@@ -34,11 +38,11 @@ def log_sidebar_event(
             # Running in background thread, just use Python logging
             import logging
 
-            logging.info(f"[{stage}] {message}")
+            logging.info("[%s] %s", stage, message)
             return
 
         _init_event_store()
-        events = list(st.session_state.sidebar_events)
+        events = st.session_state.sidebar_events
         events.append(
             {
                 "timestamp": datetime.utcnow().strftime("%H:%M:%S"),
@@ -48,12 +52,13 @@ def log_sidebar_event(
                 "extra": extra or {},
             }
         )
-        st.session_state.sidebar_events = events[-80:]
+        if len(events) > 2 * MAX_SIDEBAR_EVENTS:
+            del events[:-MAX_SIDEBAR_EVENTS]
     except Exception:
         # Fallback to Python logging
         import logging
 
-        logging.info(f"[{stage}] {message}")
+        logging.info("[%s] %s", stage, message)
 
 
 class SidebarLogHandler(logging.Handler):
@@ -43,7 +43,7 @@ class CrossPlatformFileHandler:
             logger: Optional logger instance for tracking operations
         """
         self.logger = logger or self._create_default_logger()
-        self.temp_files = []  # Track temporary files for cleanup
+        self.temp_files = set()  # Track temporary files for cleanup
         self.platform = platform.system()
 
         # Register cleanup handler
@@ -91,7 +91,7 @@ class CrossPlatformFileHandler:
         self,
         suffix: str = "",
         prefix: str = "deepcode_",
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, memoryview]] = None,
     ) -> Path:
         """
         Create a temporary file with proper cross-platform handling.
@@ -104,7 +104,8 @@ class CrossPlatformFileHandler:
         Args:
             suffix: File suffix (e.g., ".pdf", ".txt")
             prefix: File prefix for identification
-            content: Optional content to write to the file
+            content: Optional content to write to the file (any bytes-like
+                object; memoryviews are written without an extra copy)
 
         Returns:
             Path to the created temporary file
@@ -127,8 +128,12 @@ class CrossPlatformFileHandler:
             # Write content if provided
             if content is not None:
                 try:
-                    # Write using the file descriptor (more reliable on Windows)
-                    os.write(fd, content)
+                    # Write using the file descriptor (more reliable on Windows),
+                    # looping because os.write may perform a partial write
+                    view = memoryview(content)
+                    while view:
+                        written = os.write(fd, view)
+                        view = view[written:]
                 finally:
                     # Always close the file descriptor
                     os.close(fd)
@@ -143,7 +148,7 @@ class CrossPlatformFileHandler:
                 self.logger.info(f"Created empty temp file: {temp_path_obj.name}")
 
             # Track for cleanup
-            self.temp_files.append(temp_path_obj)
+            self.temp_files.add(temp_path_obj)
 
             return temp_path_obj
 
@@ -326,9 +331,8 @@ class CrossPlatformFileHandler:
             path.unlink()
             self.logger.info(f"Removed file: {path.name}")
 
-            # Remove from tracking list if present
-            if path in self.temp_files:
-                self.temp_files.remove(path)
+            # Remove from tracking set if present
+            self.temp_files.discard(path)
 
             return True
 
@@ -354,9 +358,8 @@ class CrossPlatformFileHandler:
         cleaned = 0
         failed = 0
 
-        for temp_file in self.temp_files[
-            :
-        ]:  # Copy list to avoid modification during iteration
+        # Copy to avoid modification during iteration
+        for temp_file in list(self.temp_files):
             if self.safe_remove_file(temp_file):
                 cleaned += 1
             else:
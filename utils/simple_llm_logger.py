@@ -12,6 +12,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # orjson 可选，缺失时回退到标准库json
+    orjson = None
+
 
 class SimpleLLMLogger:
     """超简化的LLM响应日志记录器"""
@@ -148,7 +153,10 @@ class SimpleLLMLogger:
         try:
             with open(self.log_file, "a", encoding="utf-8") as f:
                 if output_format == "json":
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    if orjson is not None:
+                        f.write(orjson.dumps(entry).decode("utf-8") + "\n")
+                    else:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
                 elif output_format == "text":
                     timestamp = entry.get("timestamp", "")
                     model = entry.get("model", "")